@@ -6,6 +6,7 @@ Run this script to create a distributable .exe file
 import subprocess
 import sys
 import os
+import shutil
 from pathlib import Path
 
 def install_pyinstaller():
@@ -23,7 +24,7 @@ def build_executable():
     # PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",                    # Create single executable
+        "--onedir",                     # Folder build, no unpacking on every launch
         "--windowed",                   # No console window
         "--name", "WindowsAppLock",     # Executable name
         "--icon", "icon.ico",           # Icon file (if exists)
@@ -32,6 +33,9 @@ def build_executable():
         "--hidden-import", "pystray",
         "--hidden-import", "PIL",
         "--hidden-import", "psutil",
+        "--exclude-module", "tkinter.test",
+        "--exclude-module", "unittest",
+        "--exclude-module", "pydoc",
         "main.py"
     ]
     
@@ -46,8 +50,8 @@ def build_executable():
     try:
         subprocess.check_call(cmd)
         print("\n✅ Build successful!")
-        print("Executable created: dist/WindowsAppLock.exe")
-        print("\nYou can now distribute the executable file.")
+        print("Executable created: dist/WindowsAppLock/WindowsAppLock.exe")
+        print("\nYou can now distribute the dist/WindowsAppLock folder.")
         
         # Create distribution folder with necessary files
         create_distribution()
@@ -56,22 +60,34 @@ def build_executable():
         print(f"\n❌ Build failed with error code {e.returncode}")
         print("Please check the error messages above.")
 
+def link_or_copy(src, dst):
+    """Hard-link src to dst, falling back to a copy (e.g. across volumes)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
 def create_distribution():
     """Create distribution folder with all necessary files"""
     dist_folder = Path("distribution")
     dist_folder.mkdir(exist_ok=True)
     
-    # Copy executable
-    exe_source = Path("dist/WindowsAppLock.exe")
-    if exe_source.exists():
-        import shutil
-        shutil.copy2(exe_source, dist_folder / "WindowsAppLock.exe")
+    # Copy the application folder (executable plus its bundled libraries)
+    app_source = Path("dist/WindowsAppLock")
+    if app_source.exists():
+        app_target = dist_folder / "WindowsAppLock"
+        if app_target.exists():
+            shutil.rmtree(app_target)
+        shutil.copytree(app_source, app_target, copy_function=link_or_copy)
         
     # Copy README
     readme_source = Path("README.md")
     if readme_source.exists():
-        import shutil
-        shutil.copy2(readme_source, dist_folder / "README.md")
+        readme_target = dist_folder / "README.md"
+        if readme_target.exists():
+            readme_target.unlink()
+        link_or_copy(readme_source, readme_target)
     
     # Create batch file for easy running
     batch_content = """@echo off
@@ -81,7 +97,7 @@ echo IMPORTANT: For full functionality, run this as Administrator
 echo Right-click this file and select "Run as administrator"
 echo.
 pause
-WindowsAppLock.exe
+WindowsAppLock\\WindowsAppLock.exe
 """
     
     with open(dist_folder / "Run_AppLock.bat", "w") as f:
@@ -141,7 +157,7 @@ def main():
     
     print("\n🎉 Build process completed!")
     print("\nNext steps:")
-    print("1. Test the executable: dist/WindowsAppLock.exe")
+    print("1. Test the executable: dist/WindowsAppLock/WindowsAppLock.exe")
     print("2. Distribute the files in the 'distribution' folder")
     print("3. Remind users to run as Administrator for full functionality")
 
@@ -4,33 +4,245 @@ A comprehensive application to lock/block access to specific Windows application
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox
 import psutil
-import subprocess
 import threading
+import queue
 import time
 import json
+import logging
 import hashlib
+import hmac
+import secrets
 import os
+import re
 import sys
-from datetime import datetime, timedelta
-import pystray
-from PIL import Image, ImageDraw
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+# Used from the monitor thread, where per-event output should cost nothing
+# unless enabled; main() shows warnings and above
+logger = logging.getLogger(__name__)
+
+# Use orjson for config I/O when it is installed, falling back to the stdlib
+try:
+    import orjson
+
+    def dumps_json(data, indent=True):
+        """Serialize data to JSON bytes, indented unless indent is False"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_json(data, indent=True):
+        """Serialize data to JSON bytes, indented unless indent is False"""
+        if indent:
+            return json.dumps(data, indent=2).encode('utf-8')
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    loads_json = json.loads
+
+def write_file_atomic(path, data):
+    """Write bytes to path via a temp file and rename, so a crash can't truncate it"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def blocked_app_key(path):
+    """Normalize an executable path into the key used in blocked_apps"""
+    return os.path.normcase(os.path.realpath(path))
+
+def normalize_blocked_apps(blocked_apps):
+    """Re-key a blocked_apps mapping by normalized executable path"""
+    return {blocked_app_key(config.setdefault('path', path)): config
+            for path, config in blocked_apps.items()}
+
+# How often the process list refreshes while its tab is on screen
+PROCESS_REFRESH_MS = 3000
+
+# Delay before each consecutive failed show-window password is reported,
+# doubling per failure and capped at the last entry
+AUTH_BACKOFF_MS = (250, 500, 1000, 2000, 4000)
+
+# WMI error code returned by NextEvent when no event arrived within the timeout
+WBEM_E_TIMED_OUT = 0x80043001
+
+# How often the event-driven monitor still sweeps all running processes, so
+# apps whose time restriction begins while they run are caught too
+PROCESS_SWEEP_SECONDS = 5
+
+# Key derivation settings for newly stored password hashes. scrypt is
+# memory-hard (32 MiB per hash); PBKDF2 is used if OpenSSL lacks scrypt.
+PBKDF2_ITERATIONS = 200000
+if hasattr(hashlib, 'scrypt'):
+    PASSWORD_KDF = {'name': 'scrypt', 'n': 2 ** 15, 'r': 8, 'p': 1}
+else:
+    PASSWORD_KDF = {'name': 'pbkdf2_sha256', 'iterations': PBKDF2_ITERATIONS}
+
+def derive_password_hash(password, salt, kdf):
+    """Derive a 32-byte password hash; a None salt means legacy unsalted SHA-256"""
+    password = password.encode('utf-8')
+    if salt is None:
+        return hashlib.sha256(password).digest()
+    salt = bytes.fromhex(salt)
+    if kdf['name'] == 'scrypt':
+        return hashlib.scrypt(password, salt=salt, n=kdf['n'], r=kdf['r'], p=kdf['p'],
+                              maxmem=256 * kdf['n'] * kdf['r'], dklen=32)
+    return hashlib.pbkdf2_hmac('sha256', password, salt, kdf['iterations'], dklen=32)
+
+# Limits on KDF settings read from a config file, so an edited or imported
+# config can't make a password check use unbounded memory or time
+MAX_SCRYPT_N = 2 ** 20
+MAX_SCRYPT_R = 8
+MAX_SCRYPT_P = 4
+MAX_PBKDF2_ITERATIONS = 10000000
+
+def is_int_in_range(value, low, high):
+    """Check that value is an int (not a bool) with low <= value <= high"""
+    return isinstance(value, int) and not isinstance(value, bool) and low <= value <= high
+
+def kdf_from_config(config):
+    """Return the KDF settings stored in a config dict (None for legacy SHA-256)"""
+    if not config.get('password_salt'):
+        return None
+    kdf = config.get('password_kdf')
+    if not kdf:
+        raise ValueError("Salted password hash has no password_kdf settings")
+    if not isinstance(kdf, dict):
+        raise ValueError("Invalid password_kdf settings")
+    
+    if kdf.get('name') == 'scrypt':
+        n = kdf.get('n')
+        valid = (is_int_in_range(n, 2, MAX_SCRYPT_N) and n & (n - 1) == 0
+                 and is_int_in_range(kdf.get('r'), 1, MAX_SCRYPT_R)
+                 and is_int_in_range(kdf.get('p'), 1, MAX_SCRYPT_P))
+    elif kdf.get('name') == 'pbkdf2_sha256':
+        valid = is_int_in_range(kdf.get('iterations'), 1, MAX_PBKDF2_ITERATIONS)
+    else:
+        valid = False
+    if not valid:
+        raise ValueError("Invalid password_kdf settings")
+    return kdf
+
+# Default password hash (password: "admin123"), unsalted until the first login
+DEFAULT_PASSWORD_HASH = "240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9"
+
+class StoredPassword:
+    """The app password's hash, salt and KDF settings as kept in the config file"""
+    
+    def __init__(self):
+        self.set_hash(DEFAULT_PASSWORD_HASH, None, None)
+    
+    def set_hash(self, password_hash, salt, kdf):
+        """Store a hex password hash along with its raw bytes for comparison"""
+        self.hash_bytes = bytes.fromhex(password_hash)
+        self.hash = password_hash
+        self.salt = salt  # None means a legacy unsalted SHA-256 hash
+        self.kdf = kdf
+    
+    def load(self, config):
+        """Take the password settings from a config dict, keeping the hash if it has none"""
+        self.set_hash(config.get('password_hash', self.hash),
+                      config.get('password_salt'),
+                      kdf_from_config(config))
+    
+    def to_config(self):
+        """Return the password settings as config dict entries"""
+        return {
+            'password_hash': self.hash,
+            'password_salt': self.salt,
+            'password_kdf': self.kdf
+        }
+    
+    def set_password(self, password):
+        """Hash a new password with a fresh salt and the current KDF settings"""
+        salt = os.urandom(16).hex()
+        self.set_hash(derive_password_hash(password, salt, PASSWORD_KDF).hex(), salt, PASSWORD_KDF)
+    
+    def verify(self, password):
+        """Verify password against the stored hash"""
+        candidate = derive_password_hash(password, self.salt, self.kdf)
+        return hmac.compare_digest(candidate, self.hash_bytes)
+
+@lru_cache(maxsize=None)
+def minutes_since_midnight(hhmm):
+    """Parse an 'HH:MM' time restriction into minutes since midnight"""
+    hours, minutes = hhmm.split(':')
+    return int(hours) * 60 + int(minutes)
+
+@lru_cache(maxsize=None)
+def is_user_admin():
+    """Return whether the app runs with administrator rights (checked once)"""
+    # The elevation check only applies to Windows
+    if sys.platform != "win32":
+        return True
+    import ctypes
+    is_user_an_admin = ctypes.WinDLL('shell32').IsUserAnAdmin
+    is_user_an_admin.restype = ctypes.c_int
+    is_user_an_admin.argtypes = []
+    return bool(is_user_an_admin())
+
+@lru_cache(maxsize=None)
+def create_tray_image():
+    """Create the system tray icon, drawing it only on first use"""
+    # PIL is only needed once the tray is set up, so keep it off the login path
+    from PIL import Image, ImageDraw
+    
+    # Create a simple icon
+    image = Image.new('RGB', (64, 64), color='red')
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([16, 16, 48, 48], fill='white')
+    draw.text((20, 25), "AL", fill='red')
+    return image
+
+# Screen dimensions, queried from Tk once and reused for centering windows
+_screen_size = None
+
+def screen_size(widget):
+    """Return the (width, height) of the screen, caching the first answer"""
+    global _screen_size
+    if _screen_size is None:
+        _screen_size = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    return _screen_size
+
+def center_window(window, width, height):
+    """Size a window and center it on screen"""
+    # The size is fixed, so no layout pass is needed to measure the window
+    screen_width, screen_height = screen_size(window)
+    x = (screen_width - width) // 2
+    y = (screen_height - height) // 2
+    window.geometry(f'{width}x{height}+{x}+{y}')
+
+# ttk styles live in the Tk interpreter, which the app creates only once
+_styles_configured = False
+
+def configure_styles(root):
+    """Apply the manager's ttk theme and styles once per process"""
+    global _styles_configured
+    if _styles_configured:
+        return
+    style = ttk.Style(root)
+    style.theme_use('clam')
+    
+    # Configure colors
+    style.configure('Title.TLabel', font=('Arial', 16, 'bold'), background='#2c3e50', foreground='white')
+    style.configure('Heading.TLabel', font=('Arial', 12, 'bold'), background='#2c3e50', foreground='white')
+    style.configure('Custom.TFrame', background='#34495e')
+    _styles_configured = True
+
 class LoginWindow:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Windows App Lock - Login")
-        self.root.geometry("400x300")
         self.root.configure(bg='#2c3e50')
         self.root.resizable(False, False)
         
-        # Center the window
-        self.center_window()
+        # Size and center the window
+        center_window(self.root, 400, 300)
         
-        # Default password hash (password: "admin123")
-        self.password_hash = "240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9"
+        self.password = StoredPassword()
         self.load_password()
         
         # Security features
@@ -38,7 +250,10 @@ class LoginWindow:
         self.login_attempts = 0
         self.max_attempts = 3
         self.lockout_time = 30  # seconds
-        self.locked_until = None
+        self.locked_until = None  # time.monotonic() deadline while locked out
+        self._login_pending = False  # a login attempt is waiting on its delay
+        self._lockout_job = None  # pending after() id that ends the lockout
+        self._login_closed = False
         
         self.setup_login_gui()
         
@@ -48,126 +263,108 @@ class LoginWindow:
         # Focus on password entry
         self.root.after(100, lambda: self.password_entry.focus())
     
-    def center_window(self):
-        """Center the login window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f'{width}x{height}+{x}+{y}')
-    
     def load_password(self):
         """Load password hash from config file"""
         config_file = Path("app_lock_config.json")
         if config_file.exists():
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    self.password_hash = config.get('password_hash', self.password_hash)
+                self.password.load(loads_json(config_file.read_bytes()))
             except Exception as e:
                 print(f"Error loading password: {e}")
     
-    def hash_password(self, password):
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+    def save_password(self):
+        """Write the password hash back to the config file, keeping other settings"""
+        config_file = Path("app_lock_config.json")
+        try:
+            config = {}
+            if config_file.exists():
+                config = loads_json(config_file.read_bytes())
+            config.update(self.password.to_config())
+            write_file_atomic(config_file, dumps_json(config, indent=False))
+        except Exception as e:
+            print(f"Error saving password: {e}")
     
-    def verify_password(self, password):
-        """Verify password against stored hash"""
-        return self.hash_password(password) == self.password_hash
+    def upgrade_password_hash(self, password):
+        """Re-hash the password with the current KDF settings and persist it"""
+        self.password.set_password(password)
+        self.save_password()
     
     def setup_login_gui(self):
         """Setup the login GUI"""
-        # Main frame
+        # Main frame - all widgets are laid out on a single grid
         main_frame = tk.Frame(self.root, bg='#2c3e50')
         main_frame.pack(expand=True, fill='both', padx=40, pady=40)
-        
-        # Logo/Title section
-        title_frame = tk.Frame(main_frame, bg='#2c3e50')
-        title_frame.pack(pady=(0, 30))
+        main_frame.grid_columnconfigure(0, weight=1)
+        main_frame.grid_rowconfigure(8, weight=1)
         
         # App icon (using text as placeholder)
-        icon_frame = tk.Frame(title_frame, bg='#e74c3c', width=60, height=60)
-        icon_frame.pack(pady=(0, 15))
-        icon_frame.pack_propagate(False)
-        
-        icon_label = tk.Label(icon_frame, text="🔒", font=('Arial', 24), 
-                             bg='#e74c3c', fg='white')
-        icon_label.pack(expand=True)
+        icon_label = tk.Label(main_frame, text="🔒", font=('Arial', 24), 
+                             bg='#e74c3c', fg='white', width=2)
+        icon_label.grid(row=0, column=0, pady=(0, 15))
         
         # Title
-        title_label = tk.Label(title_frame, text="Windows App Lock", 
+        title_label = tk.Label(main_frame, text="Windows App Lock", 
                               font=('Arial', 18, 'bold'), 
                               bg='#2c3e50', fg='white')
-        title_label.pack()
+        title_label.grid(row=1, column=0)
         
-        subtitle_label = tk.Label(title_frame, text="Enter password to continue", 
+        subtitle_label = tk.Label(main_frame, text="Enter password to continue", 
                                  font=('Arial', 10), 
                                  bg='#2c3e50', fg='#bdc3c7')
-        subtitle_label.pack(pady=(5, 0))
-        
-        # Login form
-        form_frame = tk.Frame(main_frame, bg='#2c3e50')
-        form_frame.pack(fill='x', pady=(0, 20))
+        subtitle_label.grid(row=2, column=0, pady=(5, 30))
         
         # Password field
-        password_frame = tk.Frame(form_frame, bg='#2c3e50')
-        password_frame.pack(fill='x', pady=(0, 15))
-        
-        password_label = tk.Label(password_frame, text="Password:", 
+        password_label = tk.Label(main_frame, text="Password:", 
                                  font=('Arial', 11), 
                                  bg='#2c3e50', fg='white')
-        password_label.pack(anchor='w')
+        password_label.grid(row=3, column=0, sticky='w')
         
         self.password_var = tk.StringVar()
-        self.password_entry = tk.Entry(password_frame, textvariable=self.password_var, 
+        self.password_entry = tk.Entry(main_frame, textvariable=self.password_var, 
                                       show='*', font=('Arial', 12), 
                                       bg='#34495e', fg='white', 
                                       insertbackground='white',
                                       relief='flat', bd=5)
-        self.password_entry.pack(fill='x', pady=(5, 0), ipady=8)
+        self.password_entry.grid(row=4, column=0, sticky='ew', pady=(5, 0), ipady=8)
         
         # Bind Enter key to login
-        self.password_entry.bind('<Return>', lambda e: self.login())
+        self.password_entry.bind('<Return>', self.login)
         
         # Show/Hide password checkbox
         self.show_password = tk.BooleanVar()
-        show_cb = tk.Checkbutton(password_frame, text="Show password", 
+        show_cb = tk.Checkbutton(main_frame, text="Show password", 
                                 variable=self.show_password,
                                 command=self.toggle_password_visibility,
                                 bg='#2c3e50', fg='#bdc3c7', 
                                 selectcolor='#34495e',
                                 activebackground='#2c3e50',
                                 activeforeground='white')
-        show_cb.pack(anchor='w', pady=(5, 0))
+        show_cb.grid(row=5, column=0, sticky='w', pady=(5, 0))
         
         # Login button
-        login_btn = tk.Button(form_frame, text="Login", 
+        self.login_btn = tk.Button(main_frame, text="Login", 
                              command=self.login,
                              font=('Arial', 12, 'bold'),
                              bg='#27ae60', fg='white',
                              relief='flat', bd=0,
                              cursor='hand2',
                              pady=10)
-        login_btn.pack(fill='x', pady=(10, 0))
+        self.login_btn.grid(row=6, column=0, sticky='ew', pady=(25, 0))
         
         # Status label
         self.status_var = tk.StringVar()
-        self.status_label = tk.Label(form_frame, textvariable=self.status_var,
+        self.status_label = tk.Label(main_frame, textvariable=self.status_var,
                                     font=('Arial', 9),
                                     bg='#2c3e50', fg='#e74c3c')
-        self.status_label.pack(pady=(10, 0))
+        self.status_label.grid(row=7, column=0, pady=(10, 20))
         
         # Footer
-        footer_frame = tk.Frame(main_frame, bg='#2c3e50')
-        footer_frame.pack(side='bottom', fill='x')
-        
-        footer_label = tk.Label(footer_frame, 
+        footer_label = tk.Label(main_frame, 
                                text="Default password: admin123\nChange password in Settings after login",
                                font=('Arial', 8),
                                bg='#2c3e50', fg='#7f8c8d',
                                justify='center')
-        footer_label.pack()
+        footer_label.grid(row=8, column=0, sticky='s')
     
     def toggle_password_visibility(self):
         """Toggle password visibility"""
@@ -176,21 +373,38 @@ class LoginWindow:
         else:
             self.password_entry.config(show='*')
     
-    def is_locked_out(self):
-        """Check if currently locked out"""
-        if self.locked_until and datetime.now() < self.locked_until:
+    def is_locked_out(self, now=None):
+        """Check if currently locked out as of now (a time.monotonic() value)"""
+        if self.locked_until is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if now < self.locked_until:
             return True
-        elif self.locked_until and datetime.now() >= self.locked_until:
-            # Lockout period expired, reset
-            self.locked_until = None
-            self.login_attempts = 0
+        # Lockout period expired, reset
+        self.locked_until = None
+        self.login_attempts = 0
         return False
     
-    def login(self):
+    def login(self, event=None):
         """Handle login attempt"""
+        # An attempt is already waiting to be checked, or login has succeeded
+        if self._login_pending or self.authenticated:
+            return
+        self._login_pending = True
+        # Random 0-150ms delay so early exits and hash checks take similar
+        # time, and to slow down scripted guessing. Scheduled with after()
+        # rather than time.sleep so the Tk event loop keeps running.
+        self.root.after(secrets.randbelow(150), self.check_login)
+    
+    def check_login(self):
+        """Check the entered password once the login delay has passed"""
+        self._login_pending = False
+        now = time.monotonic()
+        
         # Check if locked out
-        if self.is_locked_out():
-            remaining = int((self.locked_until - datetime.now()).total_seconds())
+        if self.is_locked_out(now):
+            remaining = int(self.locked_until - now)
             self.status_var.set(f"Too many failed attempts. Try again in {remaining}s")
             return
         
@@ -200,10 +414,16 @@ class LoginWindow:
             self.status_var.set("Please enter a password")
             return
         
-        if self.verify_password(password):
+        if self.password.verify(password):
+            if self.password.kdf != PASSWORD_KDF:
+                self.upgrade_password_hash(password)
             self.authenticated = True
             self.status_var.set("Login successful!")
             self.login_attempts = 0  # Reset attempts on success
+            # Nothing more to submit while the window closes
+            self.password_entry.config(state='disabled')
+            self.login_btn.config(state='disabled')
+            self.password_var.set("")
             self.root.after(500, self.close_login)  # Close after brief delay
         else:
             self.login_attempts += 1
@@ -211,11 +431,11 @@ class LoginWindow:
             
             if self.login_attempts >= self.max_attempts:
                 # Lock out for specified time
-                self.locked_until = datetime.now() + timedelta(seconds=self.lockout_time)
+                self.locked_until = now + self.lockout_time
                 self.status_var.set(f"Too many failed attempts. Locked for {self.lockout_time}s")
                 # Disable login controls temporarily
                 self.password_entry.config(state='disabled')
-                self.root.after(1000, self.update_lockout_status)
+                self._lockout_job = self.root.after(self.lockout_time * 1000, self.end_lockout)
             else:
                 self.status_var.set(f"Invalid password. {remaining_attempts} attempts remaining.")
             
@@ -223,24 +443,28 @@ class LoginWindow:
             if self.login_attempts < self.max_attempts:
                 self.password_entry.focus()
     
-    def update_lockout_status(self):
-        """Update lockout status display"""
-        if self.is_locked_out():
-            remaining = int((self.locked_until - datetime.now()).total_seconds())
-            if remaining > 0:
-                self.status_var.set(f"Locked out. Try again in {remaining}s")
-                self.root.after(1000, self.update_lockout_status)
-            else:
-                self.status_var.set("Lockout expired. You may try again.")
-                self.password_entry.config(state='normal')
-                self.password_entry.focus()
-        else:
-            self.password_entry.config(state='normal')
-            self.password_entry.focus()
+    def end_lockout(self):
+        """Re-enable login controls once the lockout period has elapsed"""
+        self._lockout_job = None
+        self.locked_until = None
+        self.login_attempts = 0
+        self.status_var.set("Lockout expired. You may try again.")
+        self.password_entry.config(state='normal')
+        self.password_entry.focus()
     
     def close_login(self):
-        """Close login window"""
-        self.root.destroy()
+        """Close login window, keeping the Tk root for the main application"""
+        # The root lives on in the manager, so a second call must not touch it
+        if self._login_closed:
+            return
+        self._login_closed = True
+        if self._lockout_job is not None:
+            self.root.after_cancel(self._lockout_job)
+            self._lockout_job = None
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        self.root.withdraw()
+        self.root.quit()
     
     def on_closing(self):
         """Handle window close event"""
@@ -253,67 +477,121 @@ class LoginWindow:
         return self.authenticated
 
 class AppLockManager:
-    def __init__(self):
-        self.root = tk.Tk()
+    # Attributes fetched for each row of the processes list
+    PROCESS_ATTRS = ('pid', 'name', 'cpu_percent', 'memory_percent', 'status')
+    
+    def __init__(self, root=None):
+        # Reuse the login window's root if given, rather than initializing Tk again
+        self.root = root if root is not None else tk.Tk()
         self.root.title("Windows App Lock Manager")
-        self.root.geometry("800x600")
+        # Re-center, as a reused login root keeps the login window's position
+        center_window(self.root, 800, 600)
         self.root.configure(bg='#2c3e50')
+        self.root.resizable(True, True)
         
         # Configuration file path
         self.config_file = Path("app_lock_config.json")
+        self._config_mtime = None  # mtime of the config contents last loaded/saved
+        self._config_bytes = None  # serialized config last loaded/saved
+        # Replaced on every edit, never mutated in place, so the monitor
+        # thread always sees a complete mapping without taking a lock
         self.blocked_apps = {}
+        self._blocked_names = set()  # lowercased executable file names of blocked_apps
+        self._rescan = threading.Event()  # set when blocked_apps changes, asking the monitor to sweep
         self.monitoring = False
         self.monitor_thread = None
+        self._monitor_stop = None  # threading.Event that stops the current monitor thread
         self.tray_icon = None
+        self._toaster = None  # win10toast.ToastNotifier, created on first notification
+        self.auth_dialog = None  # show-window password dialog, built on first use
+        self._auth_failures = 0  # consecutive wrong show-window passwords
+        self._auth_retry_job = None  # pending after() id re-enabling the auth dialog's entry
+        self._auth_retry_at = 0.0  # time.monotonic() before which the next guess is refused
+        self._quitting = False
+        self._proc_cache = {}  # pid -> psutil.Process, kept across refreshes
+        self._proc_snapshot = {}  # processes_tree iid -> (casefolded name, row values) from last scan
+        self._proc_tree_rows = {}  # processes_tree iid -> row values, attached or detached
+        self._filter_job = None  # pending after() id for a debounced filter
+        self._refresh_job = None  # pending after_idle() id for a process refresh
+        self._refresh_running = False  # a background process scan is in progress
+        self._proc_snapshots = queue.Queue()  # snapshots handed from the scan thread to Tk
+        self._save_job = None  # pending after() id for a debounced config save
+        self._processes_tab_visible = False
+        self._shown_blocked_rows = {}  # blocked_apps_tree iid -> row values currently shown
+        self.password = StoredPassword()
         
-        # Default password hash (password: "admin123")
-        self.password_hash = "240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9"
-        
-        self.load_config()
         self.setup_gui()
-        self.start_monitoring()
+        self.root.deiconify()
         
-    def hash_password(self, password):
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
-    
-    def verify_password(self, password):
-        """Verify password against stored hash"""
-        return self.hash_password(password) == self.password_hash
+        # Read the config once the window is up so disk I/O doesn't delay the
+        # first paint, and start monitoring only once the blocked list is known
+        self.root.after_idle(self.start_up)
     
+    def start_up(self):
+        """Load the configuration, then start monitoring against it"""
+        self.reload_config()
+        self.start_monitoring()
+        
     def load_config(self):
         """Load configuration from file"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.blocked_apps = config.get('blocked_apps', {})
-                    self.password_hash = config.get('password_hash', self.password_hash)
-            except Exception as e:
-                print(f"Error loading config: {e}")
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return
+        
+        # Skip re-parsing if the file hasn't changed since we last read or wrote it
+        if mtime == self._config_mtime:
+            return
+        
+        try:
+            data = self.config_file.read_bytes()
+            config = loads_json(data)
+            self.password.load(config)
+            self.blocked_apps = normalize_blocked_apps(config.get('blocked_apps', {}))
+            self.update_blocked_names()
+            self._config_bytes = data
+            self._config_mtime = mtime
+        except Exception as e:
+            print(f"Error loading config: {e}")
+    
+    def reload_config(self):
+        """Load configuration and refresh the views that depend on it"""
+        self.load_config()
+        self.refresh_blocked_apps_list()
     
     def save_config(self):
         """Save configuration to file"""
-        config = {
-            'blocked_apps': self.blocked_apps,
-            'password_hash': self.password_hash
-        }
+        config = {'blocked_apps': self.blocked_apps, **self.password.to_config()}
+        # Compact output; export_config writes the indented, readable form
+        data = dumps_json(config, indent=False)
+        
+        # Nothing to write if the config is identical to what is on disk
+        if data == self._config_bytes:
+            return
+        
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            write_file_atomic(self.config_file, data)
+            self._config_bytes = data
+            self._config_mtime = os.stat(self.config_file).st_mtime_ns
         except Exception as e:
             print(f"Error saving config: {e}")
     
+    def schedule_save(self):
+        """Save the config shortly, coalescing rapid successive edits into one write"""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(500, self.flush_save)
+    
+    def flush_save(self):
+        """Write a pending debounced config save now"""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+            self.save_config()
+    
     def setup_gui(self):
         """Setup the main GUI"""
-        # Style configuration
-        style = ttk.Style()
-        style.theme_use('clam')
-        
-        # Configure colors
-        style.configure('Title.TLabel', font=('Arial', 16, 'bold'), background='#2c3e50', foreground='white')
-        style.configure('Heading.TLabel', font=('Arial', 12, 'bold'), background='#2c3e50', foreground='white')
-        style.configure('Custom.TFrame', background='#34495e')
+        configure_styles(self.root)
         
         # Main title
         title_label = ttk.Label(self.root, text="Windows App Lock Manager", style='Title.TLabel')
@@ -338,6 +616,8 @@ class AppLockManager:
         notebook.add(self.settings_frame, text="Settings")
         self.setup_settings_tab()
         
+        notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        
         # Status bar
         self.status_var = tk.StringVar()
         self.status_var.set("Ready - Monitoring: Active")
@@ -477,7 +757,10 @@ class AppLockManager:
         self.processes_tree.pack(side='left', fill='both', expand=True)
         scrollbar2.pack(side='right', fill='y')
         
-        self.refresh_processes()
+        # Scans only run while this tab is visible; the first one primes each
+        # process's CPU counters (cpu_percent reports 0.0 until it has a
+        # previous sample) and the next timer tick shows real usage
+        self.root.after(PROCESS_REFRESH_MS, self.scheduled_process_refresh)
     
     def setup_settings_tab(self):
         """Setup the settings tab"""
@@ -526,6 +809,9 @@ class AppLockManager:
         self.show_notifications = tk.BooleanVar(value=True)
         ttk.Checkbutton(monitoring_frame, text="Show notifications when blocking apps", 
                        variable=self.show_notifications).pack(anchor='w', padx=10, pady=5)
+        # Mirrored into a plain bool so the monitor thread never calls into Tk
+        self.notify_on_block = True
+        self.show_notifications.trace('w', self.update_notify_on_block)
         
         # Control buttons
         control_frame = ttk.Frame(self.settings_frame)
@@ -544,15 +830,19 @@ class AppLockManager:
     
     def browse_app(self):
         """Browse for application executable"""
+        from tkinter import filedialog
         filename = filedialog.askopenfilename(
             title="Select Application",
-            filetypes=[("Executable files", "*.exe"), ("All files", "*.*")]
+            filetypes=[("Executable files", "*.exe"), ("All files", "*.*")],
+            # Start in the local install root rather than the last-used
+            # folder, which may be a slow network share
+            initialdir=os.environ.get('ProgramFiles', 'C:\\')
         )
         if filename:
             self.app_path_var.set(filename)
             # Auto-fill name if empty
             if not self.app_name_var.get():
-                app_name = Path(filename).stem
+                app_name = os.path.splitext(os.path.basename(filename))[0]
                 self.app_name_var.set(app_name)
     
     def add_blocked_app(self):
@@ -578,8 +868,9 @@ class AppLockManager:
             'blocked': True
         }
         
-        self.blocked_apps[path] = app_config
-        self.save_config()
+        self.blocked_apps = {**self.blocked_apps, blocked_app_key(path): app_config}
+        self.update_blocked_names()
+        self.schedule_save()
         self.refresh_blocked_apps_list()
         
         # Clear form
@@ -597,88 +888,177 @@ class AppLockManager:
             messagebox.showwarning("Warning", "Please select an application to remove")
             return
         
-        item = self.blocked_apps_tree.item(selection[0])
-        app_path = None
-        
-        # Find the app path by name
-        for path, config in self.blocked_apps.items():
-            if config['name'] == item['values'][0]:
-                app_path = path
-                break
-        
-        if app_path:
-            del self.blocked_apps[app_path]
-            self.save_config()
+        # Rows are keyed by their blocked_apps key, so the selection is the key
+        key = selection[0]
+        if key in self.blocked_apps:
+            self.blocked_apps = {k: v for k, v in self.blocked_apps.items() if k != key}
+            self.update_blocked_names()
+            self.schedule_save()
             self.refresh_blocked_apps_list()
             messagebox.showinfo("Success", "Application removed from blocked list")
     
+    def update_notify_on_block(self, *args):
+        """Copy the notifications setting for use by the monitor thread"""
+        self.notify_on_block = self.show_notifications.get()
+    
+    def update_blocked_names(self):
+        """Rebuild the set of blocked executable names the monitor pre-filters on"""
+        self._blocked_names = {os.path.basename(key).lower() for key in self.blocked_apps}
+        # Newly blocked apps may already be running
+        self._rescan.set()
+    
+    def sync_tree(self, tree, old_rows, new_rows):
+        """Update a Treeview in place from old_rows to new_rows (iid -> values)"""
+        # Only rows that appeared, disappeared or changed touch the widget
+        stale = old_rows.keys() - new_rows.keys()
+        if stale:
+            tree.delete(*stale)
+        
+        # Call the Tcl widget command directly; Treeview.insert/item re-marshal
+        # their option dicts in Python on every row
+        call = tree.tk.call
+        widget = str(tree)
+        for iid, values in new_rows.items():
+            old_values = old_rows.get(iid)
+            if old_values is None:
+                call(widget, 'insert', '', 'end', '-id', iid, '-values', values)
+            elif old_values != values:
+                call(widget, 'item', iid, '-values', values)
+        return new_rows
+    
     def refresh_blocked_apps_list(self):
         """Refresh the blocked applications list"""
-        # Clear existing items
-        for item in self.blocked_apps_tree.get_children():
-            self.blocked_apps_tree.delete(item)
-        
-        # Add current blocked apps
-        for path, config in self.blocked_apps.items():
+        rows = {}
+        for key, config in self.blocked_apps.items():
             status = "Active" if config['blocked'] else "Inactive"
             time_restriction = "None"
             
             if config.get('time_restricted'):
                 time_restriction = f"{config.get('start_time', '')} - {config.get('end_time', '')}"
             
-            self.blocked_apps_tree.insert('', 'end', values=(
-                config['name'],
-                path,
-                status,
-                time_restriction
-            ))
-    
-    def refresh_processes(self):
-        """Refresh the running processes list"""
-        # Clear existing items
-        for item in self.processes_tree.get_children():
-            self.processes_tree.delete(item)
+            rows[key] = (config['name'], config['path'], status, time_restriction)
         
-        try:
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-                try:
-                    info = proc.info
-                    self.processes_tree.insert('', 'end', values=(
-                        info['pid'],
-                        info['name'],
-                        f"{info['cpu_percent']:.1f}",
-                        f"{info['memory_percent']:.1f}",
-                        info['status']
-                    ))
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        except Exception as e:
-            print(f"Error refreshing processes: {e}")
+        self._shown_blocked_rows = self.sync_tree(self.blocked_apps_tree, self._shown_blocked_rows, rows)
     
-    def filter_processes(self, *args):
-        """Filter processes based on search term"""
-        filter_text = self.process_filter_var.get().lower()
+    def get_process_info(self):
+        """Collect info for all running processes, reusing cached Process objects"""
+        pids = psutil.pids()
         
-        # Clear and repopulate
-        for item in self.processes_tree.get_children():
-            self.processes_tree.delete(item)
+        # Forget processes that have exited since the last scan
+        for pid in self._proc_cache.keys() - set(pids):
+            del self._proc_cache[pid]
         
+        infos = []
+        for pid in pids:
+            try:
+                proc = self._proc_cache.get(pid)
+                if proc is None:
+                    proc = self._proc_cache[pid] = psutil.Process(pid)
+                # Fetch all attributes in one batch of OS queries; cpu_percent is
+                # non-blocking and measured since this object's previous call.
+                # Attributes we may not read come back as None instead of raising.
+                with proc.oneshot():
+                    infos.append(proc.as_dict(attrs=self.PROCESS_ATTRS,
+                                              ad_value=None))
+            except psutil.NoSuchProcess:
+                # Exited between psutil.pids() and the attribute fetch
+                self._proc_cache.pop(pid, None)
+        return infos
+    
+    def on_tab_changed(self, event):
+        """Track whether the processes tab is shown and refresh it when it appears"""
+        notebook = event.widget
+        self._processes_tab_visible = notebook.select() == str(self.processes_frame)
+        if self._processes_tab_visible:
+            self.request_process_refresh()
+    
+    def request_process_refresh(self):
+        """Refresh the processes list once the event loop is idle, coalescing requests"""
+        if self._refresh_job is None:
+            self._refresh_job = self.root.after_idle(self.refresh_processes)
+    
+    def scheduled_process_refresh(self):
+        """Periodically refresh the processes list while it can be seen"""
+        if self._processes_tab_visible and self.root.winfo_viewable():
+            self.request_process_refresh()
+        self.root.after(PROCESS_REFRESH_MS, self.scheduled_process_refresh)
+    
+    def refresh_processes(self):
+        """Refresh the running processes list, scanning in a background thread"""
+        self._refresh_job = None
+        if self._refresh_running:
+            return
+        self._refresh_running = True
+        threading.Thread(target=self.scan_process_list, daemon=True).start()
+        self.root.after(50, self.poll_process_snapshot)
+    
+    def poll_process_snapshot(self):
+        """Apply the background scan's snapshot once it is ready, checking back until then"""
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-                try:
-                    info = proc.info
-                    if filter_text in info['name'].lower():
-                        self.processes_tree.insert('', 'end', values=(
-                            info['pid'],
-                            info['name'],
-                            f"{info['cpu_percent']:.1f}",
-                            f"{info['memory_percent']:.1f}",
-                            info['status']
-                        ))
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            snapshot = self._proc_snapshots.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self.poll_process_snapshot)
+            return
+        self.show_process_snapshot(snapshot)
+    
+    def scan_process_list(self):
+        """Build a processes list snapshot off the Tk thread and queue it for Tk"""
+        try:
+            snapshot = {}
+            for info in self.get_process_info():
+                # as_dict fills every key, with None for attributes we may not read
+                pid = info['pid']
+                name = info['name'] or ''
+                snapshot[str(pid)] = (name.casefold(), (
+                    pid,
+                    name or 'Unknown',
+                    f"{info['cpu_percent'] or 0.0:.1f}",
+                    f"{info['memory_percent'] or 0.0:.1f}",
+                    info['status'] or 'Unknown'
+                ))
         except Exception as e:
-            print(f"Error filtering processes: {e}")
+            logger.warning("Error refreshing processes: %s", e)
+            snapshot = None
+        # Tk is only touched from its own thread, which polls the queue; this
+        # also keeps a scan finishing after quit_app from calling into Tk
+        self._proc_snapshots.put(snapshot)
+    
+    def show_process_snapshot(self, snapshot):
+        """Apply a snapshot from scan_process_list to the processes tree"""
+        self._refresh_running = False
+        if snapshot is None:
+            return
+        self._proc_snapshot = snapshot
+        rows = {iid: values for iid, (name_folded, values) in snapshot.items()}
+        self._proc_tree_rows = self.sync_tree(self.processes_tree, self._proc_tree_rows, rows)
+        self.apply_process_filter()
+    
+    def filter_processes(self, *args):
+        """Filter processes based on search term, coalescing rapid keystrokes"""
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(150, self.apply_process_filter)
+    
+    def apply_process_filter(self):
+        """Show the processes from the last refresh whose name matches the filter"""
+        self._filter_job = None
+        # Space-separated terms match names containing any of them, searched
+        # with one compiled pattern per pass
+        terms = self.process_filter_var.get().casefold().split()
+        if terms:
+            search = re.compile('|'.join(map(re.escape, terms))).search
+            shown = {iid for iid, (name_folded, values) in self._proc_snapshot.items()
+                     if search(name_folded)}
+        else:
+            shown = set(self._proc_snapshot)
+        
+        # Every process keeps its row; filtering only detaches and reattaches
+        # them. Replacing the children in one call keeps the shown rows in
+        # scan order, so clearing the filter restores the list as it was.
+        tree = self.processes_tree
+        ordered = [iid for iid in self._proc_snapshot if iid in shown]
+        if list(tree.get_children()) != ordered:
+            tree.set_children('', *ordered)
     
     def kill_selected_process(self):
         """Kill the selected process"""
@@ -693,7 +1073,9 @@ class AppLockManager:
         
         if messagebox.askyesno("Confirm", f"Are you sure you want to kill process '{process_name}' (PID: {pid})?"):
             try:
-                proc = psutil.Process(pid)
+                # The Process cached by the last scan knows the process's creation
+                # time, so terminate() refuses to hit a new process reusing the PID
+                proc = self._proc_cache.get(pid) or psutil.Process(pid)
                 proc.terminate()
                 messagebox.showinfo("Success", f"Process {process_name} terminated")
                 self.refresh_processes()
@@ -710,7 +1092,7 @@ class AppLockManager:
         new_pass = self.new_password_var.get()
         confirm = self.confirm_password_var.get()
         
-        if not self.verify_password(current):
+        if not self.password.verify(current):
             messagebox.showerror("Error", "Current password is incorrect")
             return
         
@@ -722,7 +1104,7 @@ class AppLockManager:
             messagebox.showerror("Error", "Password must be at least 6 characters long")
             return
         
-        self.password_hash = self.hash_password(new_pass)
+        self.password.set_password(new_pass)
         self.save_config()
         
         # Clear fields
@@ -739,6 +1121,7 @@ class AppLockManager:
     
     def export_config(self):
         """Export configuration to file"""
+        from tkinter import filedialog
         filename = filedialog.asksaveasfilename(
             title="Export Configuration",
             defaultextension=".json",
@@ -746,32 +1129,31 @@ class AppLockManager:
         )
         if filename:
             try:
-                config = {
-                    'blocked_apps': self.blocked_apps,
-                    'password_hash': self.password_hash
-                }
-                with open(filename, 'w') as f:
-                    json.dump(config, f, indent=2)
+                config = {'blocked_apps': self.blocked_apps, **self.password.to_config()}
+                write_file_atomic(filename, dumps_json(config))
                 messagebox.showinfo("Success", f"Configuration exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export configuration: {e}")
     
     def import_config(self):
         """Import configuration from file"""
+        from tkinter import filedialog
         filename = filedialog.askopenfilename(
             title="Import Configuration",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    config = json.load(f)
+                config = loads_json(Path(filename).read_bytes())
                 
-                self.blocked_apps = config.get('blocked_apps', {})
-                self.password_hash = config.get('password_hash', self.password_hash)
+                if 'password_hash' in config:
+                    self.password.load(config)
+                self.blocked_apps = normalize_blocked_apps(config.get('blocked_apps', {}))
+                self.update_blocked_names()
                 
                 self.save_config()
                 self.refresh_blocked_apps_list()
+                
                 messagebox.showinfo("Success", f"Configuration imported from {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to import configuration: {e}")
@@ -781,84 +1163,210 @@ class AppLockManager:
         if not app_config.get('time_restricted'):
             return False
         
-        now = datetime.now().time()
-        start_time = datetime.strptime(app_config.get('start_time', '00:00'), '%H:%M').time()
-        end_time = datetime.strptime(app_config.get('end_time', '23:59'), '%H:%M').time()
+        # Restriction times are parsed once per distinct string and compared as ints
+        now = datetime.now()
+        now_time = now.hour * 60 + now.minute
+        start_time = minutes_since_midnight(app_config.get('start_time', '00:00'))
+        end_time = minutes_since_midnight(app_config.get('end_time', '23:59'))
         
         if start_time <= end_time:
-            return start_time <= now <= end_time
+            return start_time <= now_time <= end_time
         else:  # Crosses midnight
-            return now >= start_time or now <= end_time
+            return now_time >= start_time or now_time <= end_time
     
-    def monitor_processes(self):
-        """Monitor and block processes"""
-        while self.monitoring:
+    def blocking_config(self, exe_path):
+        """Return the blocked app config for exe_path if it should be blocked right now"""
+        # Process executable paths are already absolute and resolved
+        app_config = self.blocked_apps.get(os.path.normcase(exe_path))
+        if app_config is None:
+            return None
+        
+        # Check if app should be blocked
+        should_block = app_config['blocked']
+        
+        if app_config.get('time_restricted'):
+            should_block = should_block and self.is_time_restricted(app_config)
+        
+        return app_config if should_block else None
+    
+    def terminate_blocked(self, victims):
+        """Terminate (process, app config) pairs, reporting each application once"""
+        blocked = set()
+        for proc, app_config in victims:
             try:
-                for proc in psutil.process_iter(['pid', 'name', 'exe']):
-                    try:
-                        info = proc.info
-                        exe_path = info.get('exe')
-                        
-                        if exe_path and exe_path in self.blocked_apps:
-                            app_config = self.blocked_apps[exe_path]
-                            
-                            # Check if app should be blocked
-                            should_block = app_config['blocked']
-                            
-                            if app_config.get('time_restricted'):
-                                should_block = should_block and self.is_time_restricted(app_config)
-                            
-                            if should_block:
-                                proc.terminate()
-                                if self.show_notifications.get():
-                                    self.show_notification(f"Blocked application: {app_config['name']}")
-                                print(f"Blocked: {app_config['name']}")
-                    
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                proc.terminate()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            blocked.add(app_config['name'])
+        
+        for name in blocked:
+            if self.notify_on_block:
+                self.show_notification(f"Blocked application: {name}")
+            logger.info("Blocked: %s", name)
+    
+    def scan_processes(self):
+        """Check every running process against the blocked list once, returning the number blocked"""
+        if not self._blocked_names:
+            return 0
+        
+        victims = []
+        for proc in psutil.process_iter(['name'], ad_value=None):
+            try:
+                # Resolving exe is the expensive part, so rule out most
+                # processes by their (cheap) name first
+                name = proc.info['name']
+                if not name or name.lower() not in self._blocked_names:
+                    continue
+                exe_path = proc.exe()
+                app_config = exe_path and self.blocking_config(exe_path)
+                if app_config:
+                    victims.append((proc, app_config))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        
+        # Kill everything found before any notification or logging, so a
+        # family of processes started together goes down in one pass
+        self.terminate_blocked(victims)
+        return len(victims)
+    
+    def watch_process_starts(self, stop_event):
+        """Block processes as they start, using WMI process creation events (Windows only)"""
+        import pythoncom
+        import pywintypes
+        import win32com.client
+        
+        # Kernel start traces arrive as soon as a process is created but need
+        # admin rights; otherwise WMI polls the process table twice a second
+        use_start_trace = is_user_admin()
+        if use_start_trace:
+            query = "SELECT ProcessID, ProcessName FROM Win32_ProcessStartTrace"
+        else:
+            query = ("SELECT * FROM __InstanceCreationEvent WITHIN 0.5 "
+                     "WHERE TargetInstance ISA 'Win32_Process'")
+        
+        pythoncom.CoInitialize()
+        try:
+            watcher = win32com.client.GetObject("winmgmts:").ExecNotificationQuery(query)
+            
+            # Events only cover new processes, so also sweep everything that
+            # is running: at start, whenever the blocked list changes, and
+            # every few seconds for time restrictions that begin meanwhile
+            next_sweep = 0
+            while not stop_event.is_set():
+                now = time.monotonic()
+                if now >= next_sweep or self._rescan.is_set():
+                    self._rescan.clear()
+                    self.scan_processes()
+                    next_sweep = now + PROCESS_SWEEP_SECONDS
+                
+                try:
+                    # Wake up every second so stop_monitoring is noticed
+                    event = watcher.NextEvent(1000)
+                except pywintypes.com_error as e:
+                    if e.excepinfo and e.excepinfo[5] & 0xFFFFFFFF == WBEM_E_TIMED_OUT:
                         continue
+                    raise
                 
-                time.sleep(2)  # Check every 2 seconds
+                if use_start_trace:
+                    pid, name, exe_path = event.ProcessID, event.ProcessName, None
+                else:
+                    process = event.TargetInstance
+                    pid, name, exe_path = process.ProcessId, process.Name, process.ExecutablePath
+                try:
+                    proc = None
+                    # Start traces cut names off at 15 characters, so look up
+                    # the full name of any that may have been truncated
+                    if use_start_trace and name and len(name) >= 14:
+                        proc = psutil.Process(pid)
+                        name = proc.name()
+                    if not name or name.lower() not in self._blocked_names:
+                        continue
+                    if proc is None:
+                        proc = psutil.Process(pid)
+                    app_config = self.blocking_config(exe_path or proc.exe())
+                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                    continue
+                if app_config:
+                    self.terminate_blocked([(proc, app_config)])
+        finally:
+            pythoncom.CoUninitialize()
+    
+    def monitor_processes(self, stop_event):
+        """Monitor and block processes until stop_event is set"""
+        if sys.platform == "win32":
+            try:
+                self.watch_process_starts(stop_event)
+                return
+            except ImportError:
+                pass
+            except Exception as e:
+                logger.warning("Process start events unavailable, polling instead: %s", e)
+        
+        # Waiting on the event rather than sleeping lets a stop take effect at once
+        interval = 2
+        while not stop_event.is_set():
+            try:
+                self._rescan.clear()
+                # Check every 2 seconds after blocking something, backing off
+                # by a second per quiet scan to at most every 5 seconds
+                if self.scan_processes():
+                    interval = 2
+                else:
+                    interval = min(interval + 1, 5)
+                
+                # Wait in short slices so a change to the blocked list is
+                # swept at once and restarts the back-off
+                deadline = time.monotonic() + interval
+                while time.monotonic() < deadline and not stop_event.wait(0.25):
+                    if self._rescan.is_set():
+                        interval = 1  # the next quiet scan backs off to 2 seconds
+                        break
                 
             except Exception as e:
-                print(f"Error in monitoring: {e}")
-                time.sleep(5)
+                logger.warning("Error in monitoring: %s", e)
+                stop_event.wait(5)
     
     def start_monitoring(self):
         """Start process monitoring"""
         if not self.monitoring:
             self.monitoring = True
-            self.monitor_thread = threading.Thread(target=self.monitor_processes, daemon=True)
+            # Each thread gets its own event, so a quick stop/start never
+            # leaves the previous thread running alongside the new one
+            self._monitor_stop = threading.Event()
+            self.monitor_thread = threading.Thread(target=self.monitor_processes,
+                                                   args=(self._monitor_stop,), daemon=True)
             self.monitor_thread.start()
             self.status_var.set("Ready - Monitoring: Active")
     
     def stop_monitoring(self):
         """Stop process monitoring"""
         self.monitoring = False
-        self.status_var.set("Ready - Monitoring: Stopped")
+        if self._monitor_stop:
+            self._monitor_stop.set()
+        # quit_app may call this from the tray thread, which must not touch Tk
+        if not self._quitting:
+            self.status_var.set("Ready - Monitoring: Stopped")
     
     def show_notification(self, message):
         """Show system notification"""
         try:
             if sys.platform == "win32":
-                import win10toast
-                toaster = win10toast.ToastNotifier()
-                toaster.show_toast("App Lock", message, duration=3)
+                if self._toaster is None:
+                    import win10toast
+                    self._toaster = win10toast.ToastNotifier()
+                # threaded=True returns at once instead of blocking the
+                # monitor thread for the toast's duration; it returns False
+                # if a toast is still on screen
+                if not self._toaster.show_toast("App Lock", message, duration=3, threaded=True):
+                    logger.info("Notification: %s", message)
         except ImportError:
-            print(f"Notification: {message}")
-    
-    def create_tray_image(self):
-        """Create system tray icon"""
-        # Create a simple icon
-        image = Image.new('RGB', (64, 64), color='red')
-        draw = ImageDraw.Draw(image)
-        draw.rectangle([16, 16, 48, 48], fill='white')
-        draw.text((20, 25), "AL", fill='red')
-        return image
+            logger.info("Notification: %s", message)
     
     def setup_system_tray(self):
         """Setup system tray icon"""
         try:
-            image = self.create_tray_image()
+            import pystray
+            image = create_tray_image()
             
             menu = pystray.Menu(
                 pystray.MenuItem("Show", self.show_window),
@@ -872,7 +1380,8 @@ class AppLockManager:
             
             self.tray_icon = pystray.Icon("AppLock", image, "App Lock Manager", menu)
             
-            # Start tray in separate thread
+            # Start tray in separate thread; a daemon thread so an exit that
+            # skips quit_app doesn't leave the process running
             tray_thread = threading.Thread(target=self.tray_icon.run, daemon=True)
             tray_thread.start()
             
@@ -881,56 +1390,121 @@ class AppLockManager:
     
     def show_window(self, icon=None, item=None):
         """Show main window with authentication check"""
+        # The dialog is built once and hidden between uses
+        if self.auth_dialog is None:
+            self.build_auth_dialog()
+        
+        # Already open: just bring it forward, leaving any back-off running
+        if self.auth_dialog.winfo_viewable():
+            self.auth_dialog.lift()
+            return
+        
+        self.auth_status_var.set("")
+        self.auth_dialog.deiconify()
+        self.auth_dialog.lift()
+        self.auth_dialog.grab_set()
+        
+        # A failed attempt's back-off still runs if the dialog was closed and
+        # reopened, so the entry stays disabled for whatever time is left
+        remaining = self._auth_retry_at - time.monotonic()
+        if self._auth_retry_job is not None:
+            self.auth_dialog.after_cancel(self._auth_retry_job)
+            self._auth_retry_job = None
+        if remaining > 0:
+            self._auth_retry_job = self.auth_dialog.after(int(remaining * 1000) + 1,
+                                                          self.enable_auth_entry)
+        else:
+            self.enable_auth_entry()
+    
+    def build_auth_dialog(self):
+        """Create the show-window authentication dialog, initially hidden"""
         # Create a simple authentication dialog
         auth_dialog = tk.Toplevel()
+        auth_dialog.withdraw()
         auth_dialog.title("Authentication Required")
-        auth_dialog.geometry("300x150")
         auth_dialog.configure(bg='#2c3e50')
         auth_dialog.resizable(False, False)
         auth_dialog.transient(self.root)
-        auth_dialog.grab_set()
+        auth_dialog.protocol("WM_DELETE_WINDOW", self.close_auth_dialog)
         
         # Center the dialog
-        auth_dialog.update_idletasks()
-        x = (auth_dialog.winfo_screenwidth() // 2) - (150)
-        y = (auth_dialog.winfo_screenheight() // 2) - (75)
-        auth_dialog.geometry(f'300x150+{x}+{y}')
+        screen_width, screen_height = screen_size(auth_dialog)
+        x = (screen_width // 2) - (150)
+        y = (screen_height // 2) - (85)
+        auth_dialog.geometry(f'300x170+{x}+{y}')
         
         # Authentication form
         tk.Label(auth_dialog, text="Enter password to show window:", 
                 font=('Arial', 10), bg='#2c3e50', fg='white').pack(pady=10)
         
-        password_var = tk.StringVar()
-        password_entry = tk.Entry(auth_dialog, textvariable=password_var, 
-                                 show='*', font=('Arial', 10),
-                                 bg='#34495e', fg='white')
-        password_entry.pack(pady=5, padx=20, fill='x')
-        password_entry.focus()
-        
-        def authenticate():
-            if self.verify_password(password_var.get()):
-                auth_dialog.destroy()
-                self.root.deiconify()
-                self.root.lift()
-            else:
-                tk.messagebox.showerror("Error", "Invalid password!", parent=auth_dialog)
-                password_var.set("")
-                password_entry.focus()
+        self.auth_password_entry = tk.Entry(auth_dialog, show='*', font=('Arial', 10),
+                                            bg='#34495e', fg='white')
+        self.auth_password_entry.pack(pady=5, padx=20, fill='x')
         
-        def cancel():
-            auth_dialog.destroy()
+        # Failed attempts are reported inline rather than in a modal message box
+        self.auth_status_var = tk.StringVar()
+        tk.Label(auth_dialog, textvariable=self.auth_status_var,
+                font=('Arial', 9), bg='#2c3e50', fg='#e74c3c').pack()
         
         # Buttons
         btn_frame = tk.Frame(auth_dialog, bg='#2c3e50')
         btn_frame.pack(pady=10)
         
-        tk.Button(btn_frame, text="OK", command=authenticate,
+        tk.Button(btn_frame, text="OK", command=self.authenticate_show_window,
                  bg='#27ae60', fg='white', relief='flat').pack(side='left', padx=5)
-        tk.Button(btn_frame, text="Cancel", command=cancel,
+        tk.Button(btn_frame, text="Cancel", command=self.close_auth_dialog,
                  bg='#e74c3c', fg='white', relief='flat').pack(side='left', padx=5)
         
         # Bind Enter key
-        password_entry.bind('<Return>', lambda e: authenticate())
+        self.auth_password_entry.bind('<Return>', lambda e: self.authenticate_show_window())
+        self.auth_dialog = auth_dialog
+    
+    def authenticate_show_window(self):
+        """Show the main window if the dialog's password is correct"""
+        # A rejected attempt is still pending
+        if str(self.auth_password_entry['state']) == 'disabled':
+            return
+        if self.password.verify(self.auth_password_entry.get()):
+            self._auth_failures = 0
+            self.close_auth_dialog()
+            self.root.after_idle(self.reveal_window)
+        else:
+            # Report failures only after a delay that grows with each
+            # consecutive failure, with input disabled, to slow down guessing
+            # without blocking the event loop
+            delay = AUTH_BACKOFF_MS[min(self._auth_failures, len(AUTH_BACKOFF_MS) - 1)]
+            self._auth_failures += 1
+            self._auth_retry_at = time.monotonic() + delay / 1000
+            self.auth_password_entry.config(state='disabled')
+            self._auth_retry_job = self.auth_dialog.after(delay, self.reject_show_window_password)
+    
+    def reject_show_window_password(self):
+        """Tell the user the password was wrong and let them try again"""
+        self.auth_status_var.set("Invalid password!")
+        self.enable_auth_entry()
+    
+    def enable_auth_entry(self):
+        """Clear the auth dialog's entry and let the user type into it again"""
+        self._auth_retry_job = None
+        self.auth_password_entry.config(state='normal')
+        self.auth_password_entry.delete(0, 'end')
+        self.auth_password_entry.focus()
+    
+    def reveal_window(self):
+        """Bring the main window back on screen and give it focus"""
+        self.root.deiconify()
+        self.root.lift()
+        self.root.focus_force()
+    
+    def close_auth_dialog(self):
+        """Hide the authentication dialog so it can be shown again"""
+        # Drop a pending re-enable so it cannot fire into the hidden dialog;
+        # the entry stays disabled and show_window resumes the back-off
+        if self._auth_retry_job is not None:
+            self.auth_dialog.after_cancel(self._auth_retry_job)
+            self._auth_retry_job = None
+        self.auth_dialog.grab_release()
+        self.auth_dialog.withdraw()
     
     def hide_window(self, icon=None, item=None):
         """Hide main window"""
@@ -945,26 +1519,30 @@ class AppLockManager:
     
     def quit_app(self, icon=None, item=None):
         """Quit the application"""
-        self.monitoring = False
+        # Exit can come from both the tray menu and the window; quit only once
+        if self._quitting:
+            return
+        self._quitting = True
+        self.stop_monitoring()
         if self.tray_icon:
             self.tray_icon.stop()
+        # Only leave the mainloop here (this may run on the tray thread);
+        # run() saves and destroys the window on the Tk thread
         self.root.quit()
-        self.root.destroy()
     
     def run(self):
         """Run the application"""
         self.root.mainloop()
+        self.flush_save()
+        self.root.destroy()
 
 def main():
     """Main function"""
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    
     # Check if running as administrator (recommended)
-    try:
-        import ctypes
-        is_admin = ctypes.windll.shell32.IsUserAnAdmin()
-        if not is_admin:
-            print("Warning: Not running as administrator. Some features may not work properly.")
-    except:
-        pass
+    if not is_user_admin():
+        print("Warning: Not running as administrator. Some features may not work properly.")
     
     # Show login window first
     login_window = LoginWindow()
@@ -973,7 +1551,7 @@ def main():
     # Only proceed if authentication was successful
     if authenticated:
         print("Authentication successful. Starting main application...")
-        app = AppLockManager()
+        app = AppLockManager(login_window.root)
         app.run()
     else:
         print("Authentication failed or cancelled. Exiting.")